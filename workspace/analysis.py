@@ -1,8 +1,30 @@
+import sys
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
 
+# Plots are only written to PLOT_DIR unless --interactive is passed, so the
+# non-GUI Agg backend is selected before pyplot gets to probe for a display
+INTERACTIVE = "--interactive" in sys.argv[1:]
+if not INTERACTIVE:
+    matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:  # Numba is optional; aggregation falls back to pandas groupby
+    njit = None
+
+try:
+    import polars as pl
+except ImportError:  # Polars is optional; the pandas pipeline is used without it
+    pl = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -18,19 +40,70 @@ PLOT_DIR.mkdir(exist_ok=True)
 
 # Plot configuration
 plt.style.use('seaborn-v0_8' if 'seaborn-v0_8' in plt.style.available else 'default')
-FIGURE_SIZE = (12, 8)
+FIGURE_SIZE = (24, 6)  # one figure holding all three panels side by side
 TOP_N = 9
 
+FLIGHTS_CSV = "flights2022.csv"
+WEATHER_CSV = "flights_weather2022.csv"
+
+# Only the columns used by the analyses are parsed; low-cardinality string
+# columns are read as categoricals so groupby works on integer codes, and
+# numeric columns are read as float32 (skipping type inference and halving
+# the bytes the groupby kernels have to stream through)
+FLIGHTS_COLUMNS = ["origin", "dest", "airline", "dep_delay", "dep_time"]
+WEATHER_COLUMNS = ["origin", "dep_delay", "wind_gust"]
+FLIGHTS_DTYPES = {"origin": "category", "dest": "category", "airline": "category",
+                  "dep_delay": "float32", "dep_time": "float32"}
+WEATHER_DTYPES = {"origin": "category", "dep_delay": "float32", "wind_gust": "float32"}
+
+# Use PyArrow's multithreaded CSV parser when it is installed
+CSV_ENGINE = "pyarrow" if find_spec("pyarrow") is not None else "c"
+
+# CSVs larger than this are streamed in CHUNK_SIZE-row chunks and aggregated
+# on the fly, so peak memory is bounded by the chunk size, not the file size
+MAX_IN_MEMORY_BYTES = 1 << 30
+CHUNK_SIZE = 1_000_000
+
+def _read_csv_cached(csv_path, columns, dtypes):
+    """Read a CSV through a Parquet cache in DATA_DIR.
+    
+    The cache file name includes a hash of the requested columns and dtypes,
+    so changing either never reads a cache written for a different schema.
+    The cache is rebuilt whenever the CSV is newer than it; without PyArrow
+    the CSV is always parsed directly. CSVs over MAX_IN_MEMORY_BYTES are not
+    loaded at all: an iterator over CHUNK_SIZE-row chunks is returned instead.
+    """
+    csv_path = Path(csv_path)
+    schema_key = hashlib.sha1(repr((columns, sorted(dtypes.items()))).encode()).hexdigest()[:8]
+    cache_path = DATA_DIR / f"{csv_path.stem}-{schema_key}.parquet"
+    
+    if csv_path.stat().st_size > MAX_IN_MEMORY_BYTES:
+        logger.info(f"Streaming {csv_path} in chunks of {CHUNK_SIZE} rows")
+        return pd.read_csv(csv_path, engine="c", usecols=columns, dtype=dtypes, chunksize=CHUNK_SIZE)
+    
+    if CSV_ENGINE == "pyarrow" and cache_path.exists() \
+            and cache_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        logger.info(f"Reading cached {cache_path}")
+        return pd.read_parquet(cache_path, columns=columns)
+    
+    df = pd.read_csv(csv_path, engine=CSV_ENGINE, usecols=columns, dtype=dtypes)
+    if CSV_ENGINE == "pyarrow":
+        DATA_DIR.mkdir(exist_ok=True)
+        df.to_parquet(cache_path, compression="zstd")
+    return df
+
 def load_data():
     """Load flight and weather data from CSV files."""
     logger.info("Loading flight data...")
     
     try:
-        flights2022 = pd.read_csv("flights2022.csv")
-        flights_weather2022 = pd.read_csv("flights_weather2022.csv")
+        flights2022 = _read_csv_cached(FLIGHTS_CSV, FLIGHTS_COLUMNS, FLIGHTS_DTYPES)
+        flights_weather2022 = _read_csv_cached(WEATHER_CSV, WEATHER_COLUMNS, WEATHER_DTYPES)
         
-        logger.info(f"Loaded {len(flights2022)} flight records")
-        logger.info(f"Loaded {len(flights_weather2022)} weather records")
+        if isinstance(flights2022, pd.DataFrame):
+            logger.info(f"Loaded {len(flights2022)} flight records")
+        if isinstance(flights_weather2022, pd.DataFrame):
+            logger.info(f"Loaded {len(flights_weather2022)} weather records")
         
         return flights2022, flights_weather2022
     
@@ -41,75 +114,284 @@ def load_data():
         logger.error(f"Error loading data: {e}")
         raise
 
+def aggregate_chunks(data, aggregate):
+    """Apply an aggregation to a DataFrame or to every chunk of a chunked reader.
+    
+    Partial results from successive chunks are summed group by group (groups
+    with missing keys included), so the aggregation must only produce
+    additive statistics (sums and counts).
+    """
+    if isinstance(data, pd.DataFrame):
+        return aggregate(data)
+    
+    total = None
+    for chunk in data:
+        partial = aggregate(chunk)
+        if total is not None:
+            partial = pd.concat([total, partial]).groupby(
+                level=list(range(partial.index.nlevels)), sort=False, observed=True, dropna=False
+            ).sum()
+        total = partial
+    return total
+
 def preprocess_data(flights_df):
     """Create derived features for analysis."""
     logger.info("Preprocessing flight data...")
     
-    # Creating route column
-    flights_df["route"] = flights_df["origin"] + "-" + flights_df["dest"]
+    # Flag cancelled flights (no recorded departure time) once, so the
+    # aggregations below can use the fast built-in "sum" instead of a lambda
+    flights_df["_cancelled"] = flights_df["dep_time"].isna()
     
-    logger.info(f"Created {flights_df['route'].nunique()} unique routes")
-    return flights_df
+    # dep_time is not needed beyond this flag; dropping it keeps the wider
+    # float column out of every later pass over the data
+    return flights_df.drop(columns=["dep_time"])
+
+GROUP_KEYS = ["origin", "dest", "airline"]
+
+def _combine_codes(df, keys):
+    """Pack the category codes of several columns into one int64 key per row.
+    
+    A missing value is encoded as one extra code per column (the number of
+    categories), so rows missing only some of the keys keep their own group.
+    """
+    combined = np.zeros(len(df), dtype=np.int64)
+    for key in keys:
+        n_categories = len(df[key].cat.categories)
+        codes = df[key].cat.codes.to_numpy(np.int64)
+        combined = combined * (n_categories + 1) + np.where(codes < 0, n_categories, codes)
+    return combined
+
+def _split_codes(combined, df, keys):
+    """Inverse of _combine_codes: turn packed keys back into a categorical MultiIndex."""
+    levels = []
+    for key in reversed(keys):
+        categories = df[key].cat.categories
+        combined, codes = np.divmod(combined, len(categories) + 1)
+        codes[codes == len(categories)] = -1
+        levels.append(pd.Categorical.from_codes(codes, categories=categories))
+    return pd.MultiIndex.from_arrays(levels[::-1], names=keys)
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _group_delay_kernel(codes, delay, cancelled, n_groups, n_chunks):
+        """Per-group delay sum, delay count and cancellation count in one parallel pass.
+        
+        Each of the n_chunks threads accumulates a contiguous slice of rows into
+        its own row of the partial arrays, which are reduced at the end, so there are no
+        concurrent writes to the same group.
+        """
+        chunk_size = (codes.size + n_chunks - 1) // n_chunks
+        sums = np.zeros((n_chunks, n_groups))
+        counts = np.zeros((n_chunks, n_groups), dtype=np.int64)
+        cancels = np.zeros((n_chunks, n_groups), dtype=np.int64)
+        for t in prange(n_chunks):
+            for i in range(t * chunk_size, min((t + 1) * chunk_size, codes.size)):
+                g = codes[i]
+                if not np.isnan(delay[i]):
+                    sums[t, g] += delay[i]
+                    counts[t, g] += 1
+                cancels[t, g] += cancelled[i]
+        return sums.sum(axis=0), counts.sum(axis=0), cancels.sum(axis=0)
+
+def aggregate_flights(flights_df):
+    """Aggregate delays and cancellations per origin, destination and airline.
+    
+    This is the only pass over the full flight data; the route and airline
+    analyses marginalize this much smaller table instead of rescanning.
+    Rows with a missing key are kept, so that e.g. a flight without an
+    airline still counts towards its route.
+    """
+    logger.info("Aggregating flight data...")
+    
+    if njit is None:
+        return flights_df.groupby(GROUP_KEYS, sort=False, observed=True, dropna=False).agg(
+            sum_dep_delay=("dep_delay", "sum"),
+            count_dep_delay=("dep_delay", "count"),
+            total_cancellations=("_cancelled", "sum")
+        )
+    
+    # Factorize the packed (origin, dest, airline) keys into dense group ids
+    # and aggregate all three statistics in a single fused Numba pass
+    combined = _combine_codes(flights_df, GROUP_KEYS)
+    codes, groups = pd.factorize(combined, sort=False)
+    sums, counts, cancels = _group_delay_kernel(
+        codes, flights_df["dep_delay"].to_numpy(), flights_df["_cancelled"].to_numpy(),
+        len(groups), get_num_threads()
+    )
+    return pd.DataFrame(
+        {"sum_dep_delay": sums, "count_dep_delay": counts, "total_cancellations": cancels},
+        index=_split_codes(groups, flights_df, GROUP_KEYS)
+    )
+
+def _marginalize(flight_groups, level):
+    """Collapse the per-(origin, dest, airline) table onto the given index level(s).
+    
+    Groups that are missing a value in one of those levels are dropped here,
+    and only here, so each analysis loses just the rows it cannot place.
+    """
+    totals = flight_groups.groupby(level=level, sort=False, observed=True).sum()
+    return totals.assign(
+        mean_dep_delay=totals["sum_dep_delay"] / totals["count_dep_delay"]
+    )[["mean_dep_delay", "total_cancellations"]]
+
+def _with_route_column(routes):
+    """Replace an (origin, dest) index with a leading "ORIGIN-DEST" route column."""
+    return routes.set_axis(routes.index.map("-".join).rename("route")).reset_index()
 
-def analyze_routes(flights_df):
+def analyze_routes(flight_groups):
     """Analyze delays and cancellations by route."""
     logger.info("Analyzing routes...")
     
     # Calculate mean departure delay and number of canceled flights for each unique flight route
-    routes_delays_cancels = flights_df.groupby("route").agg(
-        mean_dep_delay=("dep_delay", "mean"),
-        total_cancellations=("dep_time", lambda x: x.isna().sum())
-    ).reset_index()
+    # (grouped on the origin/dest category codes, so no route strings are
+    # built until the TOP_N-row results below)
+    routes_delays_cancels = _marginalize(flight_groups, ["origin", "dest"])
+    logger.info(f"Found {len(routes_delays_cancels)} unique routes")
     
     # Identify routes with the highest mean departure delays
-    top_routes_by_delay = routes_delays_cancels.sort_values("mean_dep_delay", ascending=False).head(TOP_N)
+    top_routes_by_delay = _with_route_column(routes_delays_cancels.nlargest(TOP_N, "mean_dep_delay"))
     
     # Identify routes with the highest number of cancellations
-    top_routes_by_cancellations = routes_delays_cancels.sort_values("total_cancellations", ascending=False).head(TOP_N)
+    top_routes_by_cancellations = _with_route_column(
+        routes_delays_cancels.nlargest(TOP_N, "total_cancellations")
+    )
     
-    logger.info(f"Top route by delays: {top_routes_by_delay.iloc[0]['route']} "
-                f"({top_routes_by_delay.iloc[0]['mean_dep_delay']:.1f} min)")
-    logger.info(f"Top route by cancellations: {top_routes_by_cancellations.iloc[0]['route']} "
-                f"({top_routes_by_cancellations.iloc[0]['total_cancellations']} cancellations)")
+    # Look each top row up once; %-style arguments are only formatted if the
+    # record is actually emitted
+    worst_delay, worst_cancel = top_routes_by_delay.iloc[0], top_routes_by_cancellations.iloc[0]
+    logger.info("Top route by delays: %s (%.1f min)",
+                worst_delay["route"], float(worst_delay["mean_dep_delay"]))
+    logger.info("Top route by cancellations: %s (%d cancellations)",
+                worst_cancel["route"], int(worst_cancel["total_cancellations"]))
     
     return routes_delays_cancels, top_routes_by_delay, top_routes_by_cancellations
 
-def analyze_airlines(flights_df):
+def analyze_airlines(flight_groups):
     """Analyze delays and cancellations by airline."""
     logger.info("Analyzing airlines...")
     
     # Finding mean departure delays and total cancellations by airline
-    airlines_delays_cancels = flights_df.groupby("airline").agg(
-        mean_dep_delay=("dep_delay", "mean"),
-        total_cancellations=("dep_time", lambda x: x.isna().sum())
-    ).reset_index()
+    airlines_delays_cancels = _marginalize(flight_groups, "airline")
     
     # Identify airlines with the highest mean departure delay
-    top_airlines_by_delay = airlines_delays_cancels.sort_values("mean_dep_delay", ascending=False).head(TOP_N)
+    top_airlines_by_delay = airlines_delays_cancels.nlargest(TOP_N, "mean_dep_delay").reset_index()
     
     # Identify airlines with the highest number of cancellations
-    top_airlines_by_cancellations = airlines_delays_cancels.sort_values("total_cancellations", ascending=False).head(TOP_N)
+    top_airlines_by_cancellations = airlines_delays_cancels.nlargest(TOP_N, "total_cancellations").reset_index()
     
-    logger.info(f"Top airline by delays: {top_airlines_by_delay.iloc[0]['airline']} "
-                f"({top_airlines_by_delay.iloc[0]['mean_dep_delay']:.1f} min)")
+    worst_delay = top_airlines_by_delay.iloc[0]
+    logger.info("Top airline by delays: %s (%.1f min)",
+                worst_delay["airline"], float(worst_delay["mean_dep_delay"]))
     
     return airlines_delays_cancels, top_airlines_by_delay, top_airlines_by_cancellations
 
-def analyze_wind_impact(flights_weather_df):
-    """Analyze the impact of wind conditions on departure delays."""
-    logger.info("Analyzing wind impact on delays...")
+def aggregate_wind(flights_weather_df):
+    """Aggregate departure delays per wind condition and origin airport.
+    
+    Rows with a missing origin are kept (under a NaN origin) so that they
+    still count towards the per-wind-condition summary.
+    """
+    logger.info("Aggregating weather data...")
     
     # Group by wind conditions
-    flights_weather_df["wind_group"] = flights_weather_df["wind_gust"].apply(
-        lambda x: ">= 10mph" if x >= 10 else "< 10mph"
+    flights_weather_df["wind_group"] = pd.Categorical.from_codes(
+        (flights_weather_df["wind_gust"].to_numpy() >= 10).astype(np.int8),
+        categories=["< 10mph", ">= 10mph"]
     )
     
-    wind_grouped_data = flights_weather_df.groupby(["wind_group", "origin"]).agg(
-        mean_dep_delay=("dep_delay", "mean")
+    return flights_weather_df.groupby(["wind_group", "origin"], sort=False, observed=True, dropna=False).agg(
+        sum_dep_delay=("dep_delay", "sum"),
+        count_dep_delay=("dep_delay", "count")
+    )
+
+def _scan_csv_polars(csv_path, columns, keys):
+    """Lazily scan the given CSV columns with Polars.
+    
+    Rows with missing keys are kept; they form null-keyed groups that the
+    pandas-side marginal groupbys drop per level, as with aggregate_flights.
+    """
+    return pl.scan_csv(
+        csv_path, null_values="NA",
+        schema_overrides={c: pl.Float32 for c in columns if c not in keys}
+    ).select(columns)
+
+def scan_flight_groups(csv_path=FLIGHTS_CSV):
+    """Polars equivalent of aggregate_flights, run directly over the CSV.
+    
+    Parsing and hash aggregation are multithreaded and streamed, so the full
+    flight table is never materialized.
+    """
+    logger.info("Aggregating flight data with Polars...")
+    
+    flight_groups = _scan_csv_polars(csv_path, FLIGHTS_COLUMNS, GROUP_KEYS).group_by(GROUP_KEYS).agg(
+        sum_dep_delay=pl.col("dep_delay").sum(),
+        count_dep_delay=pl.col("dep_delay").count().cast(pl.Int64),
+        total_cancellations=pl.col("dep_time").is_null().sum().cast(pl.Int64)
+    ).sort(GROUP_KEYS).collect(engine="streaming")
+    return flight_groups.to_pandas().set_index(GROUP_KEYS)
+
+def scan_wind_groups(csv_path=WEATHER_CSV):
+    """Polars equivalent of aggregate_wind, run directly over the CSV."""
+    logger.info("Aggregating weather data with Polars...")
+    
+    # A missing gust reading falls into the low-wind group, as in aggregate_wind
+    wind_group = pl.when(pl.col("wind_gust") >= 10).then(pl.lit(">= 10mph")).otherwise(pl.lit("< 10mph"))
+    wind_groups = _scan_csv_polars(csv_path, WEATHER_COLUMNS, ["origin"]).group_by(
+        wind_group.alias("wind_group"), "origin"
+    ).agg(
+        sum_dep_delay=pl.col("dep_delay").sum(),
+        count_dep_delay=pl.col("dep_delay").count().cast(pl.Int64)
+    ).collect(engine="streaming")
+    return wind_groups.to_pandas().set_index(["wind_group", "origin"])
+
+def aggregate_data():
+    """Reduce the flight and weather data to the per-group tables the analyses use.
+    
+    Uses Polars when it is installed and the pandas pipeline otherwise. The
+    Polars scans supersede load_data entirely: the Parquet cache, the chunked
+    reader for large CSVs and the concurrent flight/weather aggregation only
+    apply to the pandas pipeline (Polars streams and multithreads on its own).
+    """
+    if pl is not None:
+        try:
+            return scan_flight_groups(), scan_wind_groups()
+        except FileNotFoundError as e:
+            logger.error(f"Data file not found: {e}")
+            raise
+    
+    flights_df, flights_weather_df = load_data()
+    
+    # The flight and weather scans are independent and spend most of their
+    # time in GIL-releasing pandas/Numba kernels, so run them side by side.
+    # The flight scan stays on the main thread: Numba's TBB threading layer
+    # hangs at interpreter exit once a parallel kernel ran on a worker thread.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        wind_future = executor.submit(aggregate_chunks, flights_weather_df, aggregate_wind)
+        flight_groups = aggregate_chunks(
+            flights_df, lambda chunk: aggregate_flights(preprocess_data(chunk))
+        )
+        return flight_groups, wind_future.result()
+
+def analyze_wind_impact(wind_groups):
+    """Analyze the impact of wind conditions on departure delays."""
+    logger.info("Analyzing wind impact on delays...")
+    
+    # Order the (few) wind/origin groups once here; the per-row aggregation
+    # skips sorting its keys
+    wind_groups = wind_groups.sort_index()
+    
+    # The per-origin breakdown has no place for flights without an origin
+    by_origin = wind_groups[wind_groups.index.get_level_values("origin").notna()]
+    wind_grouped_data = pd.DataFrame(
+        {"mean_dep_delay": by_origin["sum_dep_delay"] / by_origin["count_dep_delay"]}
     )
     
     # Summary statistics
-    wind_summary = flights_weather_df.groupby("wind_group")["dep_delay"].agg(['mean', 'count'])
+    totals = wind_groups.groupby(level="wind_group", sort=False, observed=True).sum()
+    wind_summary = pd.DataFrame({
+        "mean": totals["sum_dep_delay"] / totals["count_dep_delay"],
+        "count": totals["count_dep_delay"]
+    })
     
     print("\n" + "="*50)
     print("WIND IMPACT ANALYSIS")
@@ -121,11 +403,21 @@ def analyze_wind_impact(flights_weather_df):
     
     return wind_grouped_data, wind_summary
 
-def create_route_cancellations_plot(top_routes_by_cancellations):
+def _finish_plot(fig):
+    """Show the figure in interactive mode, otherwise release it right away."""
+    if INTERACTIVE:
+        plt.show()
+    plt.close(fig)
+
+def _save_panel(fig, ax, filename):
+    """Save just the area of one subplot (with its labels) to PLOT_DIR."""
+    bbox = ax.get_tightbbox().transformed(fig.dpi_scale_trans.inverted())
+    fig.savefig(PLOT_DIR / filename, dpi=300, bbox_inches=bbox.padded(0.1))
+
+def create_route_cancellations_plot(top_routes_by_cancellations, ax):
     """Create bar plot for routes with highest cancellations."""
     logger.info("Creating route cancellations plot...")
     
-    fig, ax = plt.subplots(figsize=FIGURE_SIZE)
     bars = ax.bar(range(len(top_routes_by_cancellations)), 
                   top_routes_by_cancellations["total_cancellations"],
                   color='red', alpha=0.7)
@@ -137,20 +429,12 @@ def create_route_cancellations_plot(top_routes_by_cancellations):
     ax.set_xticklabels(top_routes_by_cancellations["route"], rotation=45, ha='right')
     
     # Add value labels on bars
-    for i, bar in enumerate(bars):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                f'{int(height)}', ha='center', va='bottom')
-    
-    plt.tight_layout()
-    plt.savefig(PLOT_DIR / "route_cancellations.png", dpi=300, bbox_inches='tight')
-    plt.show()
+    ax.bar_label(bars, fmt='%d', padding=3)
 
-def create_airline_delays_plot(top_airlines_by_delay):
+def create_airline_delays_plot(top_airlines_by_delay, ax):
     """Create bar plot for airlines with highest mean delays."""
     logger.info("Creating airline delays plot...")
     
-    fig, ax = plt.subplots(figsize=FIGURE_SIZE)
     bars = ax.bar(range(len(top_airlines_by_delay)), 
                   top_airlines_by_delay["mean_dep_delay"],
                   color='orange', alpha=0.7)
@@ -162,21 +446,12 @@ def create_airline_delays_plot(top_airlines_by_delay):
     ax.set_xticklabels(top_airlines_by_delay["airline"], rotation=45, ha='right')
     
     # Add value labels on bars
-    for i, bar in enumerate(bars):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                f'{height:.1f}', ha='center', va='bottom')
-    
-    plt.tight_layout()
-    plt.savefig(PLOT_DIR / "airline_delays.png", dpi=300, bbox_inches='tight')
-    plt.show()
+    ax.bar_label(bars, fmt='%.1f', padding=3)
 
-def create_wind_impact_plot(wind_summary):
+def create_wind_impact_plot(wind_summary, ax):
     """Create visualization for wind impact on delays."""
     logger.info("Creating wind impact plot...")
     
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
     wind_groups = wind_summary.index
     mean_delays = wind_summary['mean']
     counts = wind_summary['count']
@@ -188,14 +463,23 @@ def create_wind_impact_plot(wind_summary):
     ax.set_title("Impact of Wind Conditions on Flight Delays", fontsize=14, fontweight='bold')
     
     # Add value labels and sample sizes
-    for i, (bar, delay, count) in enumerate(zip(bars, mean_delays, counts)):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                f'{delay:.1f} min\n(n={count})', ha='center', va='bottom')
-    
-    plt.tight_layout()
-    plt.savefig(PLOT_DIR / "wind_impact.png", dpi=300, bbox_inches='tight')
-    plt.show()
+    ax.bar_label(bars, labels=[f'{delay:.1f} min\n(n={count})' for delay, count in zip(mean_delays, counts)],
+                 padding=3)
+
+def create_plots(top_routes_by_cancellations, top_airlines_by_delay, wind_summary):
+    """Render all plots into one figure, saving it and each panel to PLOT_DIR."""
+    fig, (route_ax, airline_ax, wind_ax) = plt.subplots(1, 3, figsize=FIGURE_SIZE)
+    
+    create_route_cancellations_plot(top_routes_by_cancellations, route_ax)
+    create_airline_delays_plot(top_airlines_by_delay, airline_ax)
+    create_wind_impact_plot(wind_summary, wind_ax)
+    
+    fig.tight_layout()
+    fig.savefig(PLOT_DIR / "overview.png", dpi=300, bbox_inches='tight')
+    _save_panel(fig, route_ax, "route_cancellations.png")
+    _save_panel(fig, airline_ax, "airline_delays.png")
+    _save_panel(fig, wind_ax, "wind_impact.png")
+    _finish_plot(fig)
 
 def generate_summary_report(routes_stats, airlines_stats, wind_summary):
     """Generate a summary report of the analysis."""
@@ -238,19 +522,18 @@ def main():
     logger.info("Starting flight analysis...")
     
     try:
-        # Load and preprocess data
-        flights_df, flights_weather_df = load_data()
-        flights_df = preprocess_data(flights_df)
+        # Load and aggregate data
+        flight_groups, wind_groups = aggregate_data()
         
         # Perform analyses
-        routes_stats = analyze_routes(flights_df)
-        airlines_stats = analyze_airlines(flights_df)
-        wind_data, wind_summary = analyze_wind_impact(flights_weather_df)
+        routes_stats = analyze_routes(flight_groups)
+        airlines_stats = analyze_airlines(flight_groups)
+        wind_data, wind_summary = analyze_wind_impact(wind_groups)
         
         # Create visualizations
-        create_route_cancellations_plot(routes_stats[2])  # top_routes_by_cancellations
-        create_airline_delays_plot(airlines_stats[1])     # top_airlines_by_delay
-        create_wind_impact_plot(wind_summary)
+        create_plots(routes_stats[2],    # top_routes_by_cancellations
+                     airlines_stats[1],  # top_airlines_by_delay
+                     wind_summary)
         
         # Generate summary report
         generate_summary_report(routes_stats, airlines_stats, wind_summary)